@@ -5,6 +5,7 @@ then appended to it to have a full prediction pipeline.
 """
 
 import pandas as pd
+import torch
 from sklearn.pipeline import Pipeline
 
 from deepts.datasets import load_stallion
@@ -48,15 +49,21 @@ model_kwargs = {
         "industry_volume",
     ],
 }
-model = Seq2Seq(**model_kwargs)
+
+# Allow TF32 matmuls and run the forward pass in bfloat16.
+torch.set_float32_matmul_precision("high")
+model = Seq2Seq(**model_kwargs, precision="bf16-mixed")
 
 # Combine model and preprocessor into a single prediction pipeline.
 inverse_steps = ["datetime", "target"]
 pipeline = PreprocessorEstimatorPipeline(preprocessor, model, inverse_steps)
 
-X[GROUP_COLS] = X[GROUP_COLS].astype("category")
-X[DATETIME_COL] = pd.to_datetime(X[DATETIME_COL])
-X["industry_volume"] = X["industry_volume"].astype(float)
+# Cast all columns in a single pass. An explicit datetime format avoids
+# per-row format inference.
+dtypes = {col: "category" for col in GROUP_COLS}
+dtypes["industry_volume"] = "float64"
+X = X.astype(dtypes)
+X[DATETIME_COL] = pd.to_datetime(X[DATETIME_COL], format="%Y-%m-%d", cache=True)
 
 pipeline.fit(X)
 output = pipeline.predict(X)
@@ -1,3 +1,3 @@
-from deepts.adapters._skorch import SkorchAdapter
+from deepts.adapters._skorch import MixedPrecisionNeuralNet, SkorchAdapter
 
-__all__ = ["SkorchAdapter"]
+__all__ = ["SkorchAdapter", "MixedPrecisionNeuralNet"]
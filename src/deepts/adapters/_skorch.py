@@ -1,8 +1,61 @@
-from typing import Type
+from typing import Literal, Type
 
 import skorch
+import torch
 
-__all__ = ["SkorchAdapter"]
+__all__ = ["SkorchAdapter", "MixedPrecisionNeuralNet"]
+
+
+class MixedPrecisionNeuralNet(skorch.NeuralNet):
+    """skorch :class:`NeuralNet` with optional mixed precision forward pass.
+
+    Parameters
+    ----------
+    precision : str {"32", "bf16-mixed"}, default="32"
+        If "bf16-mixed", forward passes run under :func:`torch.autocast`
+        with ``torch.bfloat16``. bfloat16 has the same exponent range as
+        float32, so no gradient scaling is needed.
+
+    *args, **kwargs
+        Positional and key-word arguments passed to :class:`NeuralNet`.
+    """
+
+    _precisions = ("32", "bf16-mixed")
+
+    def __init__(
+        self, *args, precision: Literal["32", "bf16-mixed"] = "32", **kwargs
+    ):
+        if precision not in self._precisions:
+            raise ValueError(
+                '`precision` can be either "32" or "bf16-mixed". '
+                f"Got {precision} instead."
+            )
+
+        super().__init__(*args, **kwargs)
+        self.precision = precision
+
+    def infer(self, x, **fit_params):
+        if self.precision == "32":
+            return super().infer(x, **fit_params)
+
+        device_type = torch.device(self.device or "cpu").type
+        with torch.autocast(device_type, dtype=torch.bfloat16):
+            y_infer = super().infer(x, **fit_params)
+
+        # Outputs are cast back to float32 since bfloat16 tensors cannot be
+        # converted to numpy (e.g., during predict).
+        return _to_float32(y_infer)
+
+
+def _to_float32(data):
+    """Casts floating point tensors in ``data`` to float32."""
+    if isinstance(data, torch.Tensor):
+        return data.float() if data.is_floating_point() else data
+    if isinstance(data, dict):
+        return {k: _to_float32(v) for k, v in data.items()}
+    if isinstance(data, (tuple, list)):
+        return type(data)(_to_float32(v) for v in data)
+    return data
 
 
 class SkorchAdapter:
@@ -1,4 +1,6 @@
 from typing import (
+    Any,
+    Dict,
     List,
     Optional,
     Union
@@ -9,6 +11,16 @@ import numpy as np
 from torch.utils.data import Dataset as TorchDataset
 
 
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    """Returns a read-only view of ``arr``.
+
+    A view is used so that the array passed by the caller stays writeable.
+    """
+    view = arr.view()
+    view.setflags(write=False)
+    return view
+
+
 class SliceDataset(Sequence, TorchDataset):
     """Makes Dataset sliceable.
 
@@ -18,8 +30,9 @@ class SliceDataset(Sequence, TorchDataset):
     a torch dataset. To prevent this, use this wrapper class for your
     dataset.
 
-    ``dataset`` attributes are also available from :class:`SliceDataset`
-    object (see Examples section).
+    Only a subset of the ``dataset`` interface is exposed (e.g.,
+    :meth:`get_parameters`); other attributes must be accessed through
+    :attr:`dataset`.
 
     Parameters
     ----------
@@ -57,10 +70,10 @@ class SliceDataset(Sequence, TorchDataset):
     ):
         self.dataset = dataset
         self.indices = indices
-        self.indices_ = (
-            self.indices if self.indices is not None
-            else np.arange(len(self.dataset))
-        )
+        self.indices_ = _readonly(np.asarray(
+            indices if indices is not None else np.arange(len(dataset)),
+            dtype=np.int64
+        ))
         self.ndim = 1
 
     @property
@@ -80,27 +93,32 @@ class SliceDataset(Sequence, TorchDataset):
         """
         return data
 
-    def __getattr__(self, attr):
-        """If attr is not in self, look in self.dataset.
+    def get_parameters(self) -> Dict[str, Any]:
+        """Returns the parameters of the wrapped dataset.
 
-        Notes
-        -----
-        Issues with serialization were solved with the following discussion:
-        https://stackoverflow.com/questions/49380224/how-to-make-classes-with-getattr-pickable
+        See :meth:`deepts.data.TimeseriesDataset.get_parameters`.
         """
-        if 'dataset' not in vars(self):
-            raise AttributeError
-        return getattr(self.dataset, attr)
+        return self.dataset.get_parameters()
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.indices_ = _readonly(self.indices_)
 
     def __len__(self):
-        return len(self.indices_)
+        return self.indices_.shape[0]
 
     def __getitem__(self, i):
+        # Exact type checks first: DataLoader fetches single samples with
+        # plain ints, so the common case skips the isinstance checks below.
+        index_type = type(i)
+        if index_type is int:
+            return self.transform(self.dataset[int(self.indices_[i])])
+        if index_type is slice:
+            return SliceDataset(self.dataset, indices=self.indices_[i])
+
         if isinstance(i, (int, np.integer)):
-            Xn = self.dataset[self.indices_[i]]
+            Xn = self.dataset[int(self.indices_[i])]
             return self.transform(Xn)
-        if isinstance(i, slice):
-            return SliceDataset(self.dataset, indices=self.indices_[i])
         if isinstance(i, np.ndarray):
             if i.ndim != 1:
                 raise IndexError(
@@ -108,6 +126,14 @@ class SliceDataset(Sequence, TorchDataset):
                     "dimensional arrays, got {} dimensions "
                     "instead".format(i.ndim)
                 )
-            if i.dtype == np.bool:
+            if i.dtype.kind == 'b':
+                if i.shape[0] != len(self):
+                    raise IndexError(
+                        "Boolean index did not match SliceDataset length; "
+                        "got {} elements instead of {}".format(
+                            i.shape[0], len(self)
+                        )
+                    )
                 i = np.flatnonzero(i)
+
         return SliceDataset(self.dataset, indices=self.indices_[i])
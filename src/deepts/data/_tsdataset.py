@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import dataclasses
 import inspect
-from copy import deepcopy
+import os
+from functools import cached_property
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import torch
 from pytorch_forecasting.data import encoders, timeseries
@@ -26,46 +28,57 @@ class TimeseriesFeatures:
     time_varying_unknown_categoricals: list[str]
     time_varying_unknown_reals: list[str]
 
+    def __post_init__(self):
+        # Derived feature groups are computed once since they are accessed
+        # repeatedly when building datasets, scalers and encoders.
+        self._target_names = (
+            tuple(self.target)
+            if isinstance(self.target, list)
+            else (self.target,)
+        )
+        self._reals = tuple(
+            self.static_reals
+            + self.time_varying_known_reals
+            + self.time_varying_unknown_reals
+        )
+        self._categoricals = tuple(
+            self.static_categoricals
+            + self.time_varying_known_categoricals
+            + self.time_varying_unknown_categoricals
+        )
+
     def dict(self) -> dict[str, list]:
         return dataclasses.asdict(self)
 
     @property
-    def target_names(self) -> list[str]:
-        """Returns list of target names.
+    def target_names(self) -> tuple[str, ...]:
+        """Returns target names.
 
         Returns
         -------
-        list of str
+        tuple of str
         """
-        return self.target if isinstance(self.target, list) else [self.target]
+        return self._target_names
 
     @property
-    def reals(self) -> list[str]:
+    def reals(self) -> tuple[str, ...]:
         """Continuous variables as used for modelling.
 
         Returns
         -------
-        List[str]: list of variables
+        tuple of str
         """
-        return (
-            self.static_reals
-            + self.time_varying_known_reals
-            + self.time_varying_unknown_reals
-        )
+        return self._reals
 
     @property
-    def categoricals(self) -> list[str]:
+    def categoricals(self) -> tuple[str, ...]:
         """Categorical variables as used for modelling.
 
         Returns
         -------
-        List[str]: list of variables
+        tuple of str
         """
-        return (
-            self.static_categoricals
-            + self.time_varying_known_categoricals
-            + self.time_varying_unknown_categoricals
-        )
+        return self._categoricals
 
 
 class TimeseriesDataset(TorchDataset):
@@ -119,6 +132,22 @@ class TimeseriesDataset(TorchDataset):
     add_encoder_length : bool, default=True
         If True, adds encoder length to list of static real variables.
         Recommended if ``min_encoder_length != max_encoder_length``.
+
+    categorical_encoders : dict, str -> Transformer, default=None
+        Dictionary from categorical variable to encoder. Fitted encoders are
+        used as is. If None, a :class:`NaNLabelEncoder` is fitted for each
+        categorical variable.
+
+    scalers : dict, str -> Transformer, default=None
+        Dictionary from real variable to scaler. Fitted scalers are used as
+        is. Given entries override the defaults, that is, an
+        :class:`IdentityTransformer` for every real variable excluding the
+        target.
+
+    Notes
+    -----
+    The underlying pytorch-forecasting dataset is created on first access
+    (e.g., when the dataset is indexed or its parameters are requested).
     """
 
     def __init__(
@@ -140,6 +169,7 @@ class TimeseriesDataset(TorchDataset):
         randomize_length: None | tuple[float, float] | bool = False,
         add_encoder_length: bool = True,
         categorical_encoders: dict[str, base.Transformer] | None = None,
+        scalers: dict[str, base.Transformer] | None = None,
         predict_mode: bool = False,
     ):
         self.time_idx = time_idx
@@ -162,9 +192,19 @@ class TimeseriesDataset(TorchDataset):
         self.predict_mode = predict_mode
         self.features = self.create_ts_features()
         self.categorical_encoders = (
-            categorical_encoders or self.get_default_encoders()
+            categorical_encoders or self.get_default_encoders(data)
         )
-        self._pyforecasting_dataset = self.create_pyforecasting_dataset(data)
+        self.scalers = scalers
+        self._data = data
+
+    @cached_property
+    def _pyforecasting_dataset(self) -> timeseries.TimeSeriesDataSet:
+        """pytorch-forecasting dataset, created on first access."""
+        pyforecasting_dataset = self.create_pyforecasting_dataset(self._data)
+
+        # The raw data is no longer needed.
+        del self._data
+        return pyforecasting_dataset
 
     @property
     def decoded_index(self) -> pd.DataFrame:
@@ -175,6 +215,17 @@ class TimeseriesDataset(TorchDataset):
     def data(self) -> dict[str, torch.Tensor]:
         return self._pyforecasting_dataset.data
 
+    @property
+    def reals(self) -> list[str]:
+        """Continuous variables in the order they appear in the samples
+        ``x_cont`` tensor (e.g., including ``encoder_length``).
+
+        Returns
+        -------
+        list of str
+        """
+        return self._pyforecasting_dataset.reals
+
     def create_ts_features(self) -> TimeseriesFeatures:
         return TimeseriesFeatures(
             target=self.target,
@@ -197,13 +248,12 @@ class TimeseriesDataset(TorchDataset):
         -------
         pytorch_forecasting.data.timeseries.TimeSeriesDataset
         """
-        if (
-            self.add_encoder_length
-            and "encoder_length" not in self.features.reals
-        ):
-            self.features.static_reals.append("encoder_length")
+        # ``encoder_length`` is added to a local copy so that ``self.features``
+        # always reflects the user given features.
+        features = self.features.dict()
+        features["static_reals"] = self.get_static_reals()
 
-        return timeseries.TimeSeriesDataSet(
+        pyforecasting_dataset = timeseries.TimeSeriesDataSet(
             data=data,
             time_idx=self.time_idx,
             group_ids=self.group_ids,
@@ -212,12 +262,36 @@ class TimeseriesDataset(TorchDataset):
             min_encoder_length=self.min_encoder_length,
             min_prediction_length=self.min_prediction_length,
             randomize_length=self.randomize_length,
-            scalers=self.get_default_scalers(),
+            add_encoder_length=self.add_encoder_length,
+            scalers={**self.get_default_scalers(), **(self.scalers or {})},
             categorical_encoders=self.categorical_encoders,
             predict_mode=self.predict_mode,
-            **self.features.dict(),
+            **features,
         )
 
+        # Continuous variables are stored column-major, which makes every
+        # sample window a strided gather. Store them row-major so that each
+        # window is a single contiguous block.
+        reals = pyforecasting_dataset.data["reals"]
+        pyforecasting_dataset.data["reals"] = reals.to(torch.float).contiguous()
+        return pyforecasting_dataset
+
+    def get_static_reals(self) -> list[str]:
+        """Returns static real variables, including ``encoder_length`` if
+        :attr:`add_encoder_length` is True.
+
+        Returns
+        -------
+        list of str
+        """
+        static_reals = self.features.static_reals
+        if (
+            self.add_encoder_length
+            and "encoder_length" not in self.features.reals
+        ):
+            static_reals = static_reals + ["encoder_length"]
+        return static_reals
+
     def get_parameters(self) -> dict[str, Any]:
         """Get parameters that can be used with :py:meth:`~from_parameters` to
         create a new dataset with the same scalers.
@@ -229,12 +303,22 @@ class TimeseriesDataset(TorchDataset):
         init_signature = inspect.signature(self.__class__.__init__)
         to_exclude = ("self", "data")
 
-        return {
+        parameters = {
             name: getattr(self, name)
             for name in init_signature.parameters.keys()
             if name not in to_exclude
         }
 
+        # pytorch-forecasting fits its own copy of the given encoders and
+        # scalers. Return the fitted ones so that new datasets reuse them
+        # instead of refitting.
+        pyforecasting_parameters = self._pyforecasting_dataset.get_parameters()
+        parameters["categorical_encoders"] = pyforecasting_parameters[
+            "categorical_encoders"
+        ]
+        parameters["scalers"] = pyforecasting_parameters["scalers"]
+        return parameters
+
     @classmethod
     def from_parameters(
         cls, parameters: dict[str, Any], data: pd.DataFrame, **kwargs
@@ -242,21 +326,90 @@ class TimeseriesDataset(TorchDataset):
         """Generate dataset with different underlying data but same variable
         encoders and scalers, etc.
 
+        Notes
+        -----
+        Only list values (column names) in ``parameters`` are copied, i.e.,
+        the fitted encoders are shared with the dataset the parameters were
+        obtained from.
+
         Returns
         -------
         TimeseriesDataset
         """
-        parameters = deepcopy(parameters)
+        parameters = {
+            k: list(v) if isinstance(v, list) else v
+            for k, v in parameters.items()
+        }
         parameters.update(kwargs)
         new = cls(data, **parameters)
         return new
 
+    def to_dataloader(
+        self, train: bool = True, batch_size: int = 64, **kwargs
+    ) -> torch.utils.data.DataLoader:
+        """Constructs :class:`torch.utils.data.DataLoader` for this dataset.
+
+        By default, batches are prepared by background workers so that data
+        loading overlaps with the model step.
+
+        Parameters
+        ----------
+        train : bool, default=True
+            Whether the dataloader is used for training. If True, samples
+            are shuffled.
+
+        batch_size : int, default=64
+            Mini-batch size.
+
+        **kwargs : key-word arguments
+            Additional parameters passed to the dataloader. If given, they
+            override the defaults: ``num_workers=min(8, os.cpu_count())``,
+            ``prefetch_factor=4``, ``persistent_workers=True`` (keeps workers
+            alive between epochs instead of respawning them),
+            ``pin_memory=torch.cuda.is_available()`` and the
+            pytorch-forecasting collate function.
+
+        Returns
+        -------
+        torch.utils.data.DataLoader
+        """
+        dataloader_kwargs = dict(
+            num_workers=min(8, os.cpu_count() or 1),
+            prefetch_factor=4,
+            persistent_workers=True,
+            pin_memory=torch.cuda.is_available(),
+            collate_fn=self._pyforecasting_dataset._collate_fn,
+        )
+        dataloader_kwargs.update(kwargs)
+
+        # Worker related defaults are only valid with multiprocessing loading.
+        # User given values are passed through unchanged.
+        if not dataloader_kwargs["num_workers"]:
+            for name in ("prefetch_factor", "persistent_workers"):
+                if name not in kwargs:
+                    dataloader_kwargs.pop(name)
+
+        return torch.utils.data.DataLoader(
+            self, batch_size=batch_size, shuffle=train, **dataloader_kwargs
+        )
+
     def __getitem__(
         self, idx: int
     ) -> tuple[dict[str, torch.Tensor], torch.Tensor]:
         """Returns data sample."""
         return self._pyforecasting_dataset[idx]
 
+    def __getitems__(
+        self, indices: list[int]
+    ) -> list[tuple[dict[str, torch.Tensor], torch.Tensor]]:
+        """Returns list of data samples.
+
+        Used by :class:`torch.utils.data.DataLoader` to fetch a whole
+        mini-batch in a single call.
+        """
+        pyforecasting_dataset = self._pyforecasting_dataset
+        return [pyforecasting_dataset[idx] for idx in indices]
+
     def __len__(self):
         """Returns dataset length."""
         return len(self._pyforecasting_dataset)
@@ -269,20 +422,57 @@ class TimeseriesDataset(TorchDataset):
         -------
         Dict[str, None]
         """
+        static_reals = self.get_static_reals()
+        reals = (
+            static_reals
+            + self.features.time_varying_known_reals
+            + self.features.time_varying_unknown_reals
+        )
+        target_names = frozenset(self.features.target_names)
         return {
-            r: IdentityTransformer()
-            for r in self.features.reals
-            if r not in self.features.target_names
+            r: IdentityTransformer() for r in reals if r not in target_names
         }
 
-    def get_default_encoders(self) -> dict[str, encoders.NaNLabelEncoder]:
+    def get_default_encoders(
+        self, data: pd.DataFrame | None = None
+    ) -> dict[str, encoders.NaNLabelEncoder]:
         """Returns dictionary from categorical variable to NanLabelEncoder.
 
+        Parameters
+        ----------
+        data : pd.DataFrame, default=None
+            If given, encoders of pandas categorical columns are fitted from
+            the column categorical codes instead of letting pytorch-forecasting
+            scan (and sort) the column values. Other encoders are returned
+            unfitted.
+
         Returns
         -------
         Dict[str, NaNLabelEncoder]
         """
-        return {
-            cat: encoders.NaNLabelEncoder(warn=True)
-            for cat in self.features.categoricals
-        }
+        default_encoders = {}
+        for cat in self.features.categoricals:
+            encoder = encoders.NaNLabelEncoder(warn=True)
+            if data is not None and cat in data:
+                categories = _get_used_categories(data[cat])
+                if categories is not None:
+                    encoder.fit(categories)
+            default_encoders[cat] = encoder
+
+        return default_encoders
+
+
+def _get_used_categories(series: pd.Series) -> np.ndarray | None:
+    """Returns the categories present in ``series``.
+
+    Only the integer codes are scanned. None is returned if ``series`` is not
+    categorical or contains missing values.
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return None
+
+    codes = np.unique(series.cat.codes.to_numpy())
+    if codes.size and codes[0] < 0:
+        return None
+
+    return series.cat.categories.take(codes).to_numpy()
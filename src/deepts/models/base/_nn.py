@@ -8,7 +8,7 @@ import pandas as pd
 import skorch
 import torch
 
-from deepts.adapters import SkorchAdapter
+from deepts.adapters import MixedPrecisionNeuralNet, SkorchAdapter
 from deepts.base import Transformer
 from deepts.data import TimeseriesDataset
 from deepts.models.base import BaseModule
@@ -199,6 +199,10 @@ class TimeseriesNeuralNet(Transformer, SkorchAdapter):
         module. If set to None, then all compute devices will be left
         unmodified.
 
+    precision : str {"32", "bf16-mixed"}, default="32"
+        Floating point precision of the forward pass. If "bf16-mixed",
+        the module runs under :func:`torch.autocast` with ``torch.bfloat16``.
+
     kwargs : key-word args.
        Extra prefixed parameters (see list of supported prefixes above).
 
@@ -248,6 +252,7 @@ class TimeseriesNeuralNet(Transformer, SkorchAdapter):
         callbacks: list | None = None,
         dataset: Type[TimeseriesDataset] = TimeseriesDataset,
         output_transformer: OutputToPandasTransformer | None = None,
+        precision: Literal["32", "bf16-mixed"] = "32",
         **prefix_kwargs,
     ):
         self.module = module
@@ -277,6 +282,7 @@ class TimeseriesNeuralNet(Transformer, SkorchAdapter):
         self.min_prediction_length = min_prediction_length
         self.callbacks = callbacks
         self.output_transformer = output_transformer
+        self.precision = precision
         self.prefix_kwargs = prefix_kwargs
         self._initialized = False
 
@@ -534,6 +540,9 @@ class TimeseriesNeuralNet(Transformer, SkorchAdapter):
 
         return history
 
+    def _get_skorch_class(self) -> Type[MixedPrecisionNeuralNet]:
+        return MixedPrecisionNeuralNet
+
     def _get_skorch_object(self) -> skorch.NeuralNet:
         """Instantiates skorch :class:`NeuralNet`.
 
@@ -554,6 +563,7 @@ class TimeseriesNeuralNet(Transformer, SkorchAdapter):
             device=self.device,
             warm_start=self.warm_start,
             train_split=self.train_split,
+            precision=self.precision,
             **self.prefix_kwargs,
         )
 
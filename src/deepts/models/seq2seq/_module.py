@@ -42,7 +42,7 @@ class Seq2SeqModuleFactory(ModuleFactory):
     ) -> list[str]:
         # All continuous variables, i.e., time_varying_known_reals,
         # time_varying_known_reals and static_reals, are encoded.
-        return ds.features.reals
+        return list(ds.reals)
 
     def get_time_varying_reals_decoder(
         self, ds: TimeseriesDataset
@@ -51,7 +51,7 @@ class Seq2SeqModuleFactory(ModuleFactory):
         return ds.features.time_varying_known_reals
 
     def get_target(self, ds: TimeseriesDataset):
-        return ds.features.target_names
+        return list(ds.features.target_names)
 
     def get_kwargs(self, ds: TimeseriesDataset) -> dict[str, Any]:
         return dict(
@@ -138,6 +138,10 @@ class Seq2Seq(TimeseriesNeuralNet):
 
     callbacks: None, “disable”, or list of Callback instances, default=None
         Which callbacks to enable.
+
+    precision : str {"32", "bf16-mixed"}, default="32"
+        Floating point precision of the forward pass. If "bf16-mixed",
+        the module runs under :func:`torch.autocast` with ``torch.bfloat16``.
     """
 
     def __init__(
@@ -167,6 +171,7 @@ class Seq2Seq(TimeseriesNeuralNet):
         warm_start: bool = False,
         verbose: int = 1,
         device: Literal["cpu", "cuda"] = "cpu",
+        precision: Literal["32", "bf16-mixed"] = "32",
         **kwargs,
     ):
         super().__init__(
@@ -189,6 +194,7 @@ class Seq2Seq(TimeseriesNeuralNet):
             warm_start=warm_start,
             verbose=verbose,
             device=device,
+            precision=precision,
             train_split=train_split,
             callbacks=callbacks,
             iterator_train__collate_fn=Seq2SeqCollateFn(),
@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+import torch
+
+from deepts.adapters import MixedPrecisionNeuralNet
+
+N_SAMPLES = 32
+N_FEATURES = 4
+
+
+class LinearModule(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.linear = torch.nn.Linear(N_FEATURES, 1)
+
+    def forward(self, X):
+        return self.linear(X)
+
+
+def create_net(precision: str) -> MixedPrecisionNeuralNet:
+    return MixedPrecisionNeuralNet(
+        LinearModule,
+        criterion=torch.nn.MSELoss,
+        max_epochs=2,
+        train_split=None,
+        verbose=0,
+        precision=precision,
+    )
+
+
+class TestMixedPrecisionNeuralNet(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.X = rng.random((N_SAMPLES, N_FEATURES), dtype=np.float32)
+        self.y = rng.random((N_SAMPLES, 1), dtype=np.float32)
+
+    def test_fit_predict_bf16_mixed(self):
+        net = create_net("bf16-mixed").fit(self.X, self.y)
+        output = net.predict(self.X)
+
+        assert output.shape == (N_SAMPLES, 1)
+        assert output.dtype == np.float32
+
+    def test_fit_predict_32(self):
+        net = create_net("32").fit(self.X, self.y)
+        assert net.predict(self.X).dtype == np.float32
+
+    def test_invalid_precision(self):
+        with self.assertRaises(ValueError):
+            create_net("16")
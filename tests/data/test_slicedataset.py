@@ -0,0 +1,97 @@
+import pickle
+import unittest
+
+import numpy as np
+import torch
+from numpy.testing import assert_array_equal
+
+from deepts.data import SliceDataset
+
+N_SAMPLES = 10
+
+
+def create_tensor_dataset() -> torch.utils.data.TensorDataset:
+    X = torch.arange(N_SAMPLES).reshape(-1, 1)
+    return torch.utils.data.TensorDataset(X)
+
+
+class ColumnSliceDataset(SliceDataset):
+    def __init__(self, dataset, col, indices=None):
+        super().__init__(dataset, indices=indices)
+        self.col = col
+
+    def transform(self, data):
+        return data[self.col]
+
+
+class TestSliceDataset(unittest.TestCase):
+    def test_len(self):
+        ds = SliceDataset(create_tensor_dataset())
+        assert len(ds) == N_SAMPLES
+
+    def test_indices_dtype(self):
+        ds = SliceDataset(create_tensor_dataset(), indices=[1, 3, 5])
+        assert ds.indices_.dtype == np.int64
+        assert_array_equal(ds.indices_, [1, 3, 5])
+
+    def test_getitem_int(self):
+        ds = SliceDataset(create_tensor_dataset(), indices=[4, 2])
+        (X,) = ds[1]
+        assert X.item() == 2
+
+    def test_getitem_slice(self):
+        ds = SliceDataset(create_tensor_dataset())[2:5]
+        assert isinstance(ds, SliceDataset)
+        assert_array_equal(ds.indices_, [2, 3, 4])
+
+    def test_getitem_bool_mask(self):
+        ds = SliceDataset(create_tensor_dataset())
+        mask = np.zeros(N_SAMPLES, dtype=bool)
+        mask[[1, 7]] = True
+        assert_array_equal(ds[mask].indices_, [1, 7])
+
+    def test_getitem_array_on_subset(self):
+        ds = SliceDataset(create_tensor_dataset(), indices=[9, 8, 7])
+        assert_array_equal(ds[np.array([0, 2])].indices_, [9, 7])
+        assert_array_equal(ds[np.array([True, False, True])].indices_, [9, 7])
+
+    def test_getitem_negative_array(self):
+        ds = SliceDataset(create_tensor_dataset())
+        assert_array_equal(ds[np.array([-1])].indices_, [N_SAMPLES - 1])
+
+    def test_pickle(self):
+        ds = SliceDataset(create_tensor_dataset(), indices=[3, 1])
+        unpickled = pickle.loads(pickle.dumps(ds))
+        assert len(unpickled) == 2
+        assert_array_equal(unpickled.indices_, [3, 1])
+
+    def test_pickle_subclass_state(self):
+        ds = ColumnSliceDataset(create_tensor_dataset(), col=0)
+        unpickled = pickle.loads(pickle.dumps(ds))
+        assert unpickled.col == 0
+        assert unpickled[2].item() == 2
+
+    def test_indices_readonly(self):
+        indices = np.array([0, 2, 4])
+        ds = SliceDataset(create_tensor_dataset(), indices=indices)
+
+        assert not ds.indices_.flags.writeable
+        assert indices.flags.writeable
+        assert not pickle.loads(pickle.dumps(ds)).indices_.flags.writeable
+
+    def test_getitem_numpy_integer(self):
+        ds = SliceDataset(create_tensor_dataset(), indices=[4, 2])
+        (X,) = ds[np.int64(0)]
+        assert X.item() == 4
+
+    def test_getitem_float_array(self):
+        ds = SliceDataset(create_tensor_dataset())
+        with self.assertRaises(IndexError):
+            ds[np.array([0.5, 1.7])]
+
+    def test_getitem_array_is_copied(self):
+        ds = SliceDataset(create_tensor_dataset())
+        indices = np.array([1, 2, 3])
+        sub = ds[indices]
+        indices[0] = 9
+        assert_array_equal(sub.indices_, [1, 2, 3])
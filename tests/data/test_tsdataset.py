@@ -0,0 +1,190 @@
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+import torch
+
+from deepts.data import TimeseriesDataset
+from deepts.data._tsdataset import TimeseriesFeatures
+from deepts.preprocessing import IdentityTransformer
+
+N_TIMESTEPS = 20
+MAX_ENCODER_LENGTH = 5
+MAX_PREDICTION_LENGTH = 2
+
+
+def create_data() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    size = 2 * N_TIMESTEPS
+    return pd.DataFrame(
+        {
+            "group": pd.Categorical(np.repeat(["a", "b"], N_TIMESTEPS)),
+            "time_idx": np.tile(np.arange(N_TIMESTEPS), 2),
+            "target": rng.random(size),
+            "known": rng.random(size),
+        }
+    )
+
+
+def create_dataset(
+    data: pd.DataFrame | None = None, **kwargs
+) -> TimeseriesDataset:
+    return TimeseriesDataset(
+        data if data is not None else create_data(),
+        time_idx="time_idx",
+        target="target",
+        group_ids=["group"],
+        max_encoder_length=MAX_ENCODER_LENGTH,
+        max_prediction_length=MAX_PREDICTION_LENGTH,
+        static_categoricals=["group"],
+        time_varying_known_reals=["known"],
+        time_varying_unknown_reals=["target"],
+        add_encoder_length=False,
+        **kwargs,
+    )
+
+
+class TestTimeseriesFeatures(unittest.TestCase):
+    def create_features(self) -> TimeseriesFeatures:
+        return TimeseriesFeatures(
+            target="target",
+            static_categoricals=["group"],
+            static_reals=["static"],
+            time_varying_known_categoricals=["month"],
+            time_varying_known_reals=["known"],
+            time_varying_unknown_categoricals=[],
+            time_varying_unknown_reals=["target"],
+        )
+
+    def test_reals(self):
+        features = self.create_features()
+        assert features.reals == ("static", "known", "target")
+
+    def test_categoricals(self):
+        features = self.create_features()
+        assert features.categoricals == ("group", "month")
+
+    def test_target_names(self):
+        features = self.create_features()
+        assert features.target_names == ("target",)
+
+    def test_dict(self):
+        features = self.create_features()
+        assert "_reals" not in features.dict()
+
+
+class TestTimeseriesDataset(unittest.TestCase):
+    def test_getitems(self):
+        ds = create_dataset()
+        indices = [0, 3, 5]
+        samples = ds.__getitems__(indices)
+
+        assert len(samples) == len(indices)
+        for idx, (X, _) in zip(indices, samples):
+            torch.testing.assert_close(X["x_cont"], ds[idx][0]["x_cont"])
+
+    def test_get_default_scalers(self):
+        ds = create_dataset()
+        assert set(ds.get_default_scalers()) == {"known"}
+
+    def test_from_parameters_reuses_encoders(self):
+        ds = create_dataset()
+        data = create_data()
+        new_data = data[data["group"] == "b"]
+        new = TimeseriesDataset.from_parameters(ds.get_parameters(), new_data)
+
+        X, _ = new[0]
+        assert X["x_cat"][0, 0].item() == 1
+
+    def test_to_dataloader(self):
+        ds = create_dataset()
+        dataloader = ds.to_dataloader(batch_size=4, num_workers=0)
+        X, (y, _) = next(iter(dataloader))
+
+        assert X["encoder_cont"].shape[0] == 4
+        assert y.shape == (4, MAX_PREDICTION_LENGTH)
+
+    def test_to_dataloader_default_workers(self):
+        ds = create_dataset()
+        dataloader = ds.to_dataloader(batch_size=4)
+
+        assert dataloader.num_workers == min(8, os.cpu_count() or 1)
+        assert dataloader.prefetch_factor == 4
+        assert dataloader.persistent_workers
+
+        dataloader = ds.to_dataloader(batch_size=4, num_workers=2)
+        for _ in range(2):
+            n_samples = sum(len(y) for _, (y, _) in dataloader)
+            assert n_samples == len(ds)
+
+    def test_to_dataloader_no_workers_keeps_user_kwargs(self):
+        ds = create_dataset()
+        with self.assertRaises(ValueError):
+            ds.to_dataloader(num_workers=0, persistent_workers=True)
+
+    def test_reals_contiguous(self):
+        reals = create_dataset().data["reals"]
+        assert reals.is_contiguous()
+        assert reals.dtype == torch.float32
+
+    def test_lazy_pyforecasting_dataset(self):
+        ds = create_dataset()
+        assert "_pyforecasting_dataset" not in vars(ds)
+
+        len(ds)
+        assert "_pyforecasting_dataset" in vars(ds)
+        assert "_data" not in vars(ds)
+
+    def test_get_parameters_scalers(self):
+        ds = create_dataset()
+        assert set(ds.get_parameters()["scalers"]) >= {"known"}
+
+    def test_partial_scalers(self):
+        data = create_data()
+        data["known2"] = data["known"]
+        ds = create_dataset(
+            data,
+            time_varying_known_reals=["known", "known2"],
+            scalers={"known": IdentityTransformer()},
+        )
+        scalers = ds.get_parameters()["scalers"]
+
+        assert isinstance(scalers["known"], IdentityTransformer)
+        assert isinstance(scalers["known2"], IdentityTransformer)
+
+    def test_add_encoder_length(self):
+        static_reals = []
+        ds = TimeseriesDataset(
+            create_data(),
+            time_idx="time_idx",
+            target="target",
+            group_ids=["group"],
+            max_encoder_length=MAX_ENCODER_LENGTH,
+            max_prediction_length=MAX_PREDICTION_LENGTH,
+            static_categoricals=["group"],
+            static_reals=static_reals,
+            time_varying_known_reals=["known"],
+            time_varying_unknown_reals=["target"],
+        )
+        X, _ = ds[0]
+
+        assert "encoder_length" in ds.reals
+        assert "encoder_length" in ds.get_default_scalers()
+        assert "encoder_length" not in ds.features.reals
+        assert static_reals == []
+        assert X["x_cont"].shape[1] == len(ds.reals)
+
+    def test_get_default_encoders(self):
+        data = create_data()
+        data["group"] = data["group"].cat.add_categories(["unused"])
+        default_encoders = create_dataset(data).get_default_encoders(data)
+
+        assert default_encoders["group"].classes_ == {"a": 0, "b": 1}
+
+    def test_get_default_encoders_not_categorical(self):
+        data = create_data()
+        data["group"] = data["group"].astype(object)
+        default_encoders = create_dataset(data).get_default_encoders(data)
+
+        assert not hasattr(default_encoders["group"], "classes_")